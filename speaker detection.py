@@ -1,18 +1,127 @@
 import streamlit as st
-import speech_recognition as sr
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+import torch
+from pyannote.audio import Pipeline
+from faster_whisper import WhisperModel, decode_audio
+import logging
+import os
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # Fall back to BeautifulSoup when selectolax is not installed
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # Fall back to the NumPy keyword counter when Numba is not installed
+    njit = None
 import spacy
+from spacy.attrs import IS_STOP, IS_PUNCT, LEMMA
 from collections import Counter
-from heapq import nlargest
+import re
 import string
 import datetime
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from deep_translator import GoogleTranslator
-from pyAudioAnalysis import audioSegmentation
 
-# Load the English NLP model
-nlp = spacy.load("en_core_web_sm")
+@st.cache_resource
+def load_nlp_pipeline():
+    """
+    Loads the English NLP pipeline once and reuses it across Streamlit reruns.
+    Lemmas only need the tagger, attribute_ruler and lemmatizer, and sentence
+    boundaries come from the lightweight senter, so the parser and NER are never run.
+
+    Returns:
+        spacy.language.Language: NLP pipeline.
+    """
+    nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+    nlp.enable_pipe("senter")
+    return nlp
+
+# Load the English NLP pipeline
+nlp = load_nlp_pipeline()
+
+@st.cache_resource
+def load_http_session():
+    """
+    Creates an HTTP session that caches search results on disk, so repeated
+    queries skip the network, and keeps pooled keep-alive connections, so cache
+    misses skip the TCP/TLS handshake.
+
+    Returns:
+        requests_cache.CachedSession: Cached HTTP session.
+    """
+    session = requests_cache.CachedSession('serp_cache.sqlite', backend='sqlite', expire_after=3600,
+                                           allowable_methods=('GET',), stale_if_error=True)
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                          max_retries=Retry(total=2, backoff_factor=0.3,
+                                                            status_forcelist=(429, 500, 502, 503, 504))))
+    return session
+
+# HTTP session and headers used for web searches
+SESSION = load_http_session()
+HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+
+logger = logging.getLogger(__name__)
+
+@st.cache_resource
+def load_speech_models():
+    """
+    Loads the speaker diarization pipeline and the speech recognition model once
+    and reuses them across Streamlit reruns. Both run on the GPU when one is available.
+
+    Returns:
+        tuple: (pyannote diarization pipeline, faster-whisper model). The pipeline is None
+            when the gated model could not be downloaded.
+    """
+    # The diarization model is gated, so from_pretrained returns None without a valid token
+    diarization_pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization-3.1",
+                                                    use_auth_token=os.environ.get("HF_TOKEN"))
+    if diarization_pipeline is not None:
+        diarization_pipeline.to(torch.device("cuda" if torch.cuda.is_available() else "cpu"))
+    whisper_model = WhisperModel("small", device="auto", compute_type="int8")
+    return diarization_pipeline, whisper_model
 
+# Speaker diarization and speech recognition models
+diarization_pipeline, whisper_model = load_speech_models()
+
+# "Speaker N:" labels that recognize_speech_from_file puts at the start of each speaker turn
+_SPEAKER_LABEL_RE = re.compile(r"^\s*Speaker\s+\d+\s*:", re.IGNORECASE | re.MULTILINE)
+
+def _speaker_label(turns, turn_starts, start, end):
+    """
+    Picks the diarization label that overlaps a transcribed segment the most. Turns can
+    overlap, so a short interjection inside a long turn only claims the segments it covers.
+
+    Args:
+        turns (list): (segment, track, label) tuples from diarization.itertracks, sorted by start.
+        turn_starts (list): Start time of each turn, for bisecting.
+        start (float): Segment start in seconds.
+        end (float): Segment end in seconds.
+
+    Returns:
+        str: Label with the largest overlap, or the label of the nearest turn when none overlaps.
+    """
+    best_label, best_key = None, (0.0, 0.0)
+    # Only turns that start before the segment ends can overlap it
+    for turn, _, label in turns[:bisect_right(turn_starts, end)]:
+        shared = min(turn.end, end) - max(turn.start, start)
+        # On equal overlap the shorter turn fits the segment more tightly
+        key = (shared, -(turn.end - turn.start))
+        if shared > 0 and (best_label is None or key > best_key):
+            best_label, best_key = label, key
+    if best_label is not None:
+        return best_label
+    return min(turns, key=lambda turn: max(turn[0].start - end, start - turn[0].end))[2]
+
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: lambda file: file.getvalue()})
 def recognize_speech_from_file(audio_file_path, language='en-IN'):
     """
     Recognizes speech input from an audio file and performs speaker diarization.
@@ -24,20 +133,27 @@ def recognize_speech_from_file(audio_file_path, language='en-IN'):
     Returns:
         str: Recognized text with speaker labels, or None if unable to recognize.
     """
-    recognizer = sr.Recognizer()
+    # Decode once to 16 kHz mono, the rate Whisper expects, and share the samples
+    audio = decode_audio(audio_file_path, sampling_rate=16000)
 
-    with sr.AudioFile(audio_file_path) as source:
-        audio = recognizer.record(source)  # Read the entire audio file
+    # Find who speaks when, then transcribe the whole recording in a single pass
+    diarization = diarization_pipeline({"waveform": torch.from_numpy(audio).unsqueeze(0), "sample_rate": 16000})
+    segments, _ = whisper_model.transcribe(audio, language=language[:2], beam_size=1)
 
-    # Perform speaker diarization using pyAudioAnalysis
-    segments = audioSegmentation.speaker_diarization(audio_file_path)
+    turns = list(diarization.itertracks(yield_label=True))
+    turn_starts = [turn.start for turn, _, _ in turns]
+    speaker_ids = {}
 
     recognized_text = []
     previous_speaker = None
 
     for seg in segments:
-        speaker = seg[2]
-        speech = seg[3]
+        speech = seg.text.strip()
+        if not speech:
+            continue
+
+        label = _speaker_label(turns, turn_starts, seg.start, seg.end) if turns else None
+        speaker = speaker_ids.setdefault(label, len(speaker_ids))
 
         if speaker != previous_speaker:
             recognized_text.append(f"\nSpeaker {speaker}:")  # Add speaker label
@@ -45,8 +161,66 @@ def recognize_speech_from_file(audio_file_path, language='en-IN'):
 
         recognized_text.append(speech)
 
-    return " ".join(recognized_text)
+    return " ".join(recognized_text) or None
 
+def strip_speaker_labels(text):
+    """
+    Removes the "Speaker N:" labels from a labelled transcript, so they do not
+    turn up as tokens or keywords.
+
+    Args:
+        text (str): Transcript with speaker labels.
+
+    Returns:
+        str: Transcript without speaker labels.
+    """
+    return _SPEAKER_LABEL_RE.sub("", text)
+
+@lru_cache(maxsize=512)
+def _parse(text):
+    """
+    Parses text with spaCy, reusing the Doc when the same text is parsed again.
+
+    Args:
+        text (str): Text to be parsed.
+
+    Returns:
+        spacy.tokens.Doc: Parsed document. Callers must not modify it.
+    """
+
+    return nlp(text)
+
+def _lemma_hashes(doc):
+    """
+    Returns the lemma hashes of the tokens that are neither stop words nor punctuation.
+    The filter runs as a NumPy mask over the Doc's attribute array instead of a
+    Python loop over Token objects.
+
+    Args:
+        doc (spacy.tokens.Doc): Parsed document.
+
+    Returns:
+        numpy.ndarray: Array of uint64 lemma hashes.
+    """
+
+    attrs = doc.to_array([IS_STOP, IS_PUNCT, LEMMA])
+    return attrs[(attrs[:, 0] == 0) & (attrs[:, 1] == 0), 2]
+
+def _lemmas(doc):
+    """
+    Returns the lemmas of the tokens that are neither stop words nor punctuation.
+
+    Args:
+        doc (spacy.tokens.Doc): Parsed document.
+
+    Returns:
+        list: List of lemmas.
+    """
+
+    strings = doc.vocab.strings
+    return [strings[lemma] for lemma in _lemma_hashes(doc).tolist()]
+
+@st.cache_data(show_spinner=False)
 def preprocess_text(text):
     """
     Preprocesses text by tokenizing, lemmatizing, and removing stop words and punctuation.
@@ -58,9 +232,23 @@ def preprocess_text(text):
         list: List of preprocessed tokens.
     """
 
-    doc = nlp(text)
-    tokens = [token.lemma_ for token in doc if not token.is_stop and not token.is_punct]
-    return tokens
+    return _lemmas(_parse(text))
+
+def preprocess_texts(texts, batch_size=64, n_process=1):
+    """
+    Preprocesses many texts in one pass through spaCy's nlp.pipe.
+
+    Args:
+        texts (iterable): Texts to be preprocessed.
+        batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+        n_process (int, optional): Number of worker processes. Values above 1 must only be used
+            from code guarded by ``if __name__ == "__main__"``. Defaults to 1.
+
+    Returns:
+        list: List of preprocessed token lists, one per input text.
+    """
+
+    return [_lemmas(doc) for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)]
 
 def extract_keywords(text, num_keywords=5):
     """
@@ -74,9 +262,101 @@ def extract_keywords(text, num_keywords=5):
         list: List of top keywords.
     """
 
-    word_freq = Counter(text)
-    return nlargest(num_keywords, word_freq, key=word_freq.get)
+    return [word for word, _ in Counter(text).most_common(num_keywords)]
+
+if njit is not None:
+    @njit(cache=True)
+    def _top_lemma_hashes(attrs, num_keywords):
+        """
+        Returns the most frequent lemma hashes among tokens that are neither stop words nor
+        punctuation. Compiled with Numba, so the filter and count run as native loops.
+
+        Args:
+            attrs (numpy.ndarray): Doc.to_array([IS_STOP, IS_PUNCT, LEMMA]) output.
+            num_keywords (int): Number of lemma hashes to return.
+
+        Returns:
+            numpy.ndarray: Top lemma hashes, most frequent first.
+        """
+        kept = np.empty(attrs.shape[0], dtype=attrs.dtype)
+        num_kept = 0
+        for i in range(attrs.shape[0]):
+            if attrs[i, 0] == 0 and attrs[i, 1] == 0:
+                kept[num_kept] = attrs[i, 2]
+                num_kept += 1
+        kept = kept[:num_kept]
+        # A stable sort keeps equal hashes in text order, so each run starts at its first occurrence
+        order = np.argsort(kept, kind="mergesort")
+
+        # Count runs of equal hashes in the sorted order
+        lemmas = np.empty(num_kept, dtype=attrs.dtype)
+        counts = np.zeros(num_kept, dtype=np.int64)
+        first_seen = np.empty(num_kept, dtype=np.int64)
+        num_lemmas = 0
+        for i in range(num_kept):
+            lemma = kept[order[i]]
+            if num_lemmas == 0 or lemma != lemmas[num_lemmas - 1]:
+                lemmas[num_lemmas] = lemma
+                first_seen[num_lemmas] = order[i]
+                num_lemmas += 1
+            counts[num_lemmas - 1] += 1
+
+        # Most frequent first; ties go to the lemma seen first, as with Counter.most_common.
+        # first_seen < num_kept, so the rank orders by count and then by first position
+        rank = first_seen[:num_lemmas] - counts[:num_lemmas] * num_kept
+        return lemmas[np.argsort(rank)[:num_keywords]]
+else:
+    def _top_lemma_hashes(attrs, num_keywords):
+        """
+        Returns the most frequent lemma hashes among tokens that are neither stop words nor
+        punctuation, using NumPy when Numba is not installed.
+
+        Args:
+            attrs (numpy.ndarray): Doc.to_array([IS_STOP, IS_PUNCT, LEMMA]) output.
+            num_keywords (int): Number of lemma hashes to return.
+
+        Returns:
+            numpy.ndarray: Top lemma hashes, most frequent first.
+        """
+        lemmas, first_seen, counts = np.unique(attrs[(attrs[:, 0] == 0) & (attrs[:, 1] == 0), 2],
+                                               return_index=True, return_counts=True)
+        # Most frequent first; ties go to the lemma seen first, as with Counter.most_common
+        return lemmas[np.lexsort((first_seen, -counts))[:num_keywords]]
+
+@st.cache_data(show_spinner=False)
+def top_keywords(text, num_keywords=5):
+    """
+    Extracts the most frequent lemmas of the text, ignoring stop words and punctuation.
+    Lemmas are counted as 64-bit hashes, and only the top keywords are turned back into strings.
+
+    Args:
+        text (str): Text to extract keywords from.
+        num_keywords (int, optional): Number of keywords to extract. Defaults to 5.
+
+    Returns:
+        list: List of top keywords, most frequent first.
+    """
+
+    doc = _parse(text)
+    top = _top_lemma_hashes(doc.to_array([IS_STOP, IS_PUNCT, LEMMA]), num_keywords)
+    strings = doc.vocab.strings
+    return [strings[lemma] for lemma in top.tolist()]
+
+def _summary(doc, num_sentences):
+    """
+    Joins the first sentences of a parsed document into a summary.
 
+    Args:
+        doc (spacy.tokens.Doc): Parsed document.
+        num_sentences (int): Number of sentences to include in the summary.
+
+    Returns:
+        str: Summary of the document.
+    """
+
+    return " ".join(sent.text for sent in islice(doc.sents, num_sentences))
+
+@st.cache_data(show_spinner=False)
 def generate_summary(text, num_sentences=3):
     """
     Generates a summary of the text using spaCy's built-in summarization feature.
@@ -89,10 +369,57 @@ def generate_summary(text, num_sentences=3):
         str: Summary of the text.
     """
 
-    doc = nlp(text)
-    sentences = [sent.text for sent in doc.sents]
-    summary = " ".join(sentences[:num_sentences])
-    return summary
+    return _summary(_parse(text), num_sentences)
+
+def generate_summaries(texts, num_sentences=3, batch_size=64, n_process=1):
+    """
+    Generates summaries for many texts in one pass through spaCy's nlp.pipe.
+
+    Args:
+        texts (iterable): Texts to summarize.
+        num_sentences (int, optional): Number of sentences to include in each summary. Defaults to 3.
+        batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+        n_process (int, optional): Number of worker processes. Values above 1 must only be used
+            from code guarded by ``if __name__ == "__main__"``. Defaults to 1.
+
+    Returns:
+        list: List of summaries, one per input text.
+    """
+
+    return [_summary(doc, num_sentences) for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)]
+
+@st.cache_data(show_spinner=False)
+def analyze(text, num_sentences=3):
+    """
+    Preprocesses and summarizes text from a single spaCy parse.
+
+    Args:
+        text (str): Text to analyze.
+        num_sentences (int, optional): Number of sentences to include in the summary. Defaults to 3.
+
+    Returns:
+        tuple: (list of preprocessed tokens, summary of the text).
+    """
+
+    doc = _parse(text)
+    return _lemmas(doc), _summary(doc, num_sentences)
+
+def _extract_news(html):
+    """
+    Extracts news article snippets from a Google News results page.
+
+    Args:
+        html (str): HTML of the results page.
+
+    Returns:
+        list: List of news article snippets.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        return [node.text() for node in tree.css('div.BNeawe.vvjwJb.AP7Wnd')]
+    soup = BeautifulSoup(html, 'lxml')
+    news_results = soup.find_all('div', class_='BNeawe vvjwJb AP7Wnd')
+    return [result.get_text() for result in news_results]
 
 def search_web(translated_text):
     """
@@ -104,12 +431,33 @@ def search_web(translated_text):
     Returns:
         list: List of news article snippets.
     """
-    url = f"https://www.google.com/search?q={translated_text}&tbm=nws"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    news_results = soup.find_all('div', class_='BNeawe vvjwJb AP7Wnd')
-    return [result.get_text() for result in news_results]
+    response = SESSION.get("https://www.google.com/search", params={"q": translated_text, "tbm": "nws"},
+                           headers=HEADERS, timeout=5)
+    response.raise_for_status()
+    return _extract_news(response.text)
+
+def search_web_many(queries):
+    """
+    Searches the web for news articles for several queries concurrently.
+    The searches share the cached, pooled session used by search_web.
+
+    Args:
+        queries (list): Topics to search for, e.g. extracted keywords.
+
+    Returns:
+        dict: News article snippets for each query. Queries whose search failed are logged and map to an empty list.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {query: executor.submit(search_web, query) for query in queries}
+
+    news_articles = {}
+    for query, future in futures.items():
+        try:
+            news_articles[query] = future.result()
+        except requests.RequestException as e:
+            logger.warning("News search for %r failed: %s", query, e)
+            news_articles[query] = []
+    return news_articles
 
 def get_timestamp():
     """
@@ -134,6 +482,7 @@ def save_minutes(recognized_text, filename="meeting_minutes.txt"):
     with open(f"{filename}-{timestamp}", "w") as file:
         file.write(recognized_text)
 
+@st.cache_data(show_spinner=False)
 def translate_text(text, dest_language='en'):
     """
     Translates text to the target language using Google Translator.
@@ -148,9 +497,90 @@ def translate_text(text, dest_language='en'):
     translated_text = GoogleTranslator(source='hi-EN', target=dest_language).translate(text)
     return translated_text
 
+def _split_text(text, max_chars):
+    """
+    Splits text into pieces shorter than max_chars, cutting at spaces where possible.
+
+    Args:
+        text (str): Text to be split.
+        max_chars (int): Length that every piece must stay below.
+
+    Returns:
+        list: Pieces of the text, in order.
+    """
+    pieces = []
+    while len(text) >= max_chars:
+        cut = text.rfind(" ", 0, max_chars - 1)
+        if cut <= 0:
+            cut = max_chars - 1
+        pieces.append(text[:cut])
+        text = text[cut:]
+    pieces.append(text)
+    return pieces
+
+def translate_batch(texts, dest_language='en', max_chars=5000):
+    """
+    Translates many text segments using as few Google Translator requests as possible.
+
+    Segments are joined with newlines into payloads shorter than max_chars characters,
+    and each payload is translated in a single request. Longer segments are split first.
+
+    Args:
+        texts (list): Text segments to be translated.
+        dest_language (str, optional): Target language code. Defaults to 'en' (English).
+        max_chars (int, optional): Request size limit, exclusive. Defaults to 5000 (Google's payload limit).
+
+    Returns:
+        list: Translated segments, in the same order as the input.
+    """
+    translator = GoogleTranslator(source='auto', target=dest_language)
+
+    # Segments too long for one request are split, and their translations rejoined below
+    pieces, piece_counts = [], []
+    for text in texts:
+        split = _split_text(text, max_chars)
+        pieces.extend(split)
+        piece_counts.append(len(split))
+
+    chunks = []
+    chunk, chunk_size = [], 0
+    for piece in pieces:
+        # The payload is the pieces plus one newline between each pair
+        if chunk and chunk_size + 1 + len(piece) >= max_chars:
+            chunks.append(chunk)
+            chunk, chunk_size = [], 0
+        chunk_size += len(piece) + (1 if chunk else 0)
+        chunk.append(piece)
+    if chunk:
+        chunks.append(chunk)
+
+    translated_pieces = []
+    for chunk in chunks:
+        if any("\n" in piece for piece in chunk):
+            # Newlines inside a segment make the line split ambiguous, so translate segment by segment
+            result = translator.translate_batch(chunk)
+        else:
+            result = translator.translate("\n".join(chunk)).split("\n")
+            if len(result) != len(chunk):
+                # The translator merged or split lines, so translate this chunk segment by segment
+                result = translator.translate_batch(chunk)
+        translated_pieces.extend(result)
+
+    translated = []
+    start = 0
+    for count in piece_counts:
+        translated.append(" ".join(translated_pieces[start:start + count]))
+        start += count
+    return translated
+
 # Streamlit app
 st.title("Speech to Text Translation and Analysis")
 
+if diarization_pipeline is None:
+    st.error("Could not load the pyannote/speaker-diarization-3.1 model. Accept its user conditions on "
+             "Hugging Face and set the HF_TOKEN environment variable to your access token.")
+    st.stop()
+
 # Audio file upload
 uploaded_file = st.file_uploader("Upload an audio file", type=["wav", "mp3"])
 
@@ -166,16 +596,18 @@ if uploaded_file:
         if translated_text:
             st.write("Translated Text:", translated_text)
 
-            preprocessed_text = preprocess_text(translated_text)
+            # Analyze the transcript without speaker labels, so "speaker" and the speaker numbers
+            # do not become keywords
+            analysis_text = strip_speaker_labels(translated_text)
+            preprocessed_text, summary = analyze(analysis_text)
             st.write("Preprocessed Text:", preprocessed_text)
 
-            keywords = extract_keywords(preprocessed_text)
+            keywords = top_keywords(analysis_text)
             st.write("Keywords:", keywords)
 
-            summary = generate_summary(translated_text)
             st.write("Summary:", summary)
 
-            news_articles = search_web(translated_text)
+            news_articles = search_web_many(keywords or ["general"])
             st.write("News Articles:", news_articles)
 
             # Saving meeting minutes to a file
@@ -1,14 +1,44 @@
 import speech_recognition as sr
+import logging
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+  from selectolax.parser import HTMLParser
+except ImportError:  # Fall back to BeautifulSoup when selectolax is not installed
+  HTMLParser = None
+  from bs4 import BeautifulSoup
+import numpy as np
+try:
+  from numba import njit
+except ImportError:  # Fall back to the NumPy keyword counter when Numba is not installed
+  njit = None
 import spacy
+from spacy.attrs import IS_STOP, IS_PUNCT, LEMMA
 from collections import Counter
-from heapq import nlargest
 import string
 import datetime
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
-# Load the English NLP model
-nlp = spacy.load("en_core_web_sm")
+# Load the English NLP pipeline once. Lemmas only need the tagger, attribute_ruler
+# and lemmatizer, and sentence boundaries come from the lightweight senter, so the
+# parser and NER are never run.
+nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+nlp.enable_pipe("senter")
+
+# HTTP session that caches search results on disk so repeated queries skip the network,
+# and keeps pooled keep-alive connections so cache misses skip the TCP/TLS handshake
+SESSION = requests_cache.CachedSession('serp_cache.sqlite', backend='sqlite', expire_after=3600,
+                                        allowable_methods=('GET',), stale_if_error=True)
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.3,
+                                                        status_forcelist=(429, 500, 502, 503, 504))))
+HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+
+logger = logging.getLogger(__name__)
 
 
 def recognize_speech(language='en-IN'):
@@ -45,6 +75,50 @@ def recognize_speech(language='en-IN'):
 
   return recognized_text
 
+@lru_cache(maxsize=512)
+def _parse(text):
+  """
+  Parses text with spaCy, reusing the Doc when the same text is parsed again.
+
+  Args:
+      text (str): Text to be parsed.
+
+  Returns:
+      spacy.tokens.Doc: Parsed document. Callers must not modify it.
+  """
+
+  return nlp(text)
+
+def _lemma_hashes(doc):
+  """
+  Returns the lemma hashes of the tokens that are neither stop words nor punctuation.
+  The filter runs as a NumPy mask over the Doc's attribute array instead of a
+  Python loop over Token objects.
+
+  Args:
+      doc (spacy.tokens.Doc): Parsed document.
+
+  Returns:
+      numpy.ndarray: Array of uint64 lemma hashes.
+  """
+
+  attrs = doc.to_array([IS_STOP, IS_PUNCT, LEMMA])
+  return attrs[(attrs[:, 0] == 0) & (attrs[:, 1] == 0), 2]
+
+def _lemmas(doc):
+  """
+  Returns the lemmas of the tokens that are neither stop words nor punctuation.
+
+  Args:
+      doc (spacy.tokens.Doc): Parsed document.
+
+  Returns:
+      list: List of lemmas.
+  """
+
+  strings = doc.vocab.strings
+  return [strings[lemma] for lemma in _lemma_hashes(doc).tolist()]
+
 def preprocess_text(text):
   """
   Preprocesses text by tokenizing, lemmatizing, and removing stop words and punctuation.
@@ -56,9 +130,23 @@ def preprocess_text(text):
       list: List of preprocessed tokens.
   """
 
-  doc = nlp(text)
-  tokens = [token.lemma_ for token in doc if not token.is_stop and not token.is_punct]
-  return tokens
+  return _lemmas(_parse(text))
+
+def preprocess_texts(texts, batch_size=64, n_process=1):
+  """
+  Preprocesses many texts in one pass through spaCy's nlp.pipe.
+
+  Args:
+      texts (iterable): Texts to be preprocessed.
+      batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+      n_process (int, optional): Number of worker processes. Values above 1 must only be used
+          from code guarded by ``if __name__ == "__main__"``. Defaults to 1.
+
+  Returns:
+      list: List of preprocessed token lists, one per input text.
+  """
+
+  return [_lemmas(doc) for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)]
 
 def extract_keywords(text, num_keywords=5):
   """
@@ -72,8 +160,84 @@ def extract_keywords(text, num_keywords=5):
       list: List of top keywords.
   """
 
-  word_freq = Counter(text)
-  return nlargest(num_keywords, word_freq, key=word_freq.get)
+  return [word for word, _ in Counter(text).most_common(num_keywords)]
+
+if njit is not None:
+  @njit(cache=True)
+  def _top_lemma_hashes(attrs, num_keywords):
+    """
+    Returns the most frequent lemma hashes among tokens that are neither stop words nor
+    punctuation. Compiled with Numba, so the filter and count run as native loops.
+
+    Args:
+        attrs (numpy.ndarray): Doc.to_array([IS_STOP, IS_PUNCT, LEMMA]) output.
+        num_keywords (int): Number of lemma hashes to return.
+
+    Returns:
+        numpy.ndarray: Top lemma hashes, most frequent first.
+    """
+    kept = np.empty(attrs.shape[0], dtype=attrs.dtype)
+    num_kept = 0
+    for i in range(attrs.shape[0]):
+      if attrs[i, 0] == 0 and attrs[i, 1] == 0:
+        kept[num_kept] = attrs[i, 2]
+        num_kept += 1
+    kept = kept[:num_kept]
+    # A stable sort keeps equal hashes in text order, so each run starts at its first occurrence
+    order = np.argsort(kept, kind="mergesort")
+
+    # Count runs of equal hashes in the sorted order
+    lemmas = np.empty(num_kept, dtype=attrs.dtype)
+    counts = np.zeros(num_kept, dtype=np.int64)
+    first_seen = np.empty(num_kept, dtype=np.int64)
+    num_lemmas = 0
+    for i in range(num_kept):
+      lemma = kept[order[i]]
+      if num_lemmas == 0 or lemma != lemmas[num_lemmas - 1]:
+        lemmas[num_lemmas] = lemma
+        first_seen[num_lemmas] = order[i]
+        num_lemmas += 1
+      counts[num_lemmas - 1] += 1
+
+    # Most frequent first; ties go to the lemma seen first, as with Counter.most_common.
+    # first_seen < num_kept, so the rank orders by count and then by first position
+    rank = first_seen[:num_lemmas] - counts[:num_lemmas] * num_kept
+    return lemmas[np.argsort(rank)[:num_keywords]]
+else:
+  def _top_lemma_hashes(attrs, num_keywords):
+    """
+    Returns the most frequent lemma hashes among tokens that are neither stop words nor
+    punctuation, using NumPy when Numba is not installed.
+
+    Args:
+        attrs (numpy.ndarray): Doc.to_array([IS_STOP, IS_PUNCT, LEMMA]) output.
+        num_keywords (int): Number of lemma hashes to return.
+
+    Returns:
+        numpy.ndarray: Top lemma hashes, most frequent first.
+    """
+    lemmas, first_seen, counts = np.unique(attrs[(attrs[:, 0] == 0) & (attrs[:, 1] == 0), 2],
+                                           return_index=True, return_counts=True)
+    # Most frequent first; ties go to the lemma seen first, as with Counter.most_common
+    return lemmas[np.lexsort((first_seen, -counts))[:num_keywords]]
+
+def top_keywords(text, num_keywords=5):
+  """
+  Extracts the most frequent lemmas of the text, ignoring stop words and punctuation.
+  Lemmas are counted as 64-bit hashes, and only the top keywords are turned back into strings.
+
+  Args:
+      text (str): Text to extract keywords from.
+      num_keywords (int, optional): Number of keywords to extract. Defaults to 5.
+
+  Returns:
+      list: List of top keywords, most frequent first.
+  """
+
+  doc = _parse(text)
+  top = _top_lemma_hashes(doc.to_array([IS_STOP, IS_PUNCT, LEMMA]), num_keywords)
+  strings = doc.vocab.strings
+  return [strings[lemma] for lemma in top.tolist()]
 
 def generate_summary(text, num_sentences=3):
   """
@@ -87,11 +251,45 @@ def generate_summary(text, num_sentences=3):
       str: Summary of the text.
   """
 
-  doc = nlp(text)
-  sentences = [sent.text for sent in doc.sents]
-  summary = " ".join(sentences[:num_sentences])
+  doc = _parse(text)
+  summary = " ".join(sent.text for sent in islice(doc.sents, num_sentences))
   return summary
 
+def generate_summaries(texts, num_sentences=3, batch_size=64, n_process=1):
+  """
+  Generates summaries for many texts in one pass through spaCy's nlp.pipe.
+
+  Args:
+      texts (iterable): Texts to summarize.
+      num_sentences (int, optional): Number of sentences to include in each summary. Defaults to 3.
+      batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+      n_process (int, optional): Number of worker processes. Values above 1 must only be used
+          from code guarded by ``if __name__ == "__main__"``. Defaults to 1.
+
+  Returns:
+      list: List of summaries, one per input text.
+  """
+
+  return [" ".join(sent.text for sent in islice(doc.sents, num_sentences))
+          for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)]
+
+def _extract_news(html):
+  """
+  Extracts news article snippets from a Google News results page.
+
+  Args:
+      html (str): HTML of the results page.
+
+  Returns:
+      list: List of news article snippets.
+  """
+  if HTMLParser is not None:
+    tree = HTMLParser(html)
+    return [node.text() for node in tree.css('div.BNeawe.vvjwJb.AP7Wnd')]
+  soup = BeautifulSoup(html, 'lxml')
+  news_results = soup.find_all('div', class_='BNeawe vvjwJb AP7Wnd')
+  return [result.get_text() for result in news_results]
+
 def search_web(topic):
   """
   Searches the web for news articles related to the provided topic.
@@ -103,12 +301,33 @@ def search_web(topic):
       list: List of news article snippets.
   """
 
-  url = f"https://www.google.com/search?q={topic}&tbm=nws"
-  headers = {"User-Agent": "Mozilla/5.0"}
-  response = requests.get(url, headers=headers)
-  soup = BeautifulSoup(response.text, 'html.parser')
-  news_results = soup.find_all('div', class_='BNeawe vvjwJb AP7Wnd')
-  return [result.get_text() for result in news_results]
+  response = SESSION.get("https://www.google.com/search", params={"q": topic, "tbm": "nws"},
+                         headers=HEADERS, timeout=5)
+  response.raise_for_status()
+  return _extract_news(response.text)
+
+def search_web_many(queries):
+  """
+  Searches the web for news articles for several queries concurrently.
+  The searches share the cached, pooled session used by search_web.
+
+  Args:
+      queries (list): Topics to search for, e.g. extracted keywords.
+
+  Returns:
+      dict: News article snippets for each query. Queries whose search failed are logged and map to an empty list.
+  """
+  with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = {query: executor.submit(search_web, query) for query in queries}
+
+  news_articles = {}
+  for query, future in futures.items():
+    try:
+      news_articles[query] = future.result()
+    except requests.RequestException as e:
+      logger.warning("News search for %r failed: %s", query, e)
+      news_articles[query] = []
+  return news_articles
 
 def get_timestamp():
   """
@@ -130,6 +349,6 @@ def save_minutes(meeting_minutes, filename="meeting_minutes.txt"):
   """
 
   timestamp = get_timestamp()
+  minutes = "".join(f"Segment {i + 1}:\n{speech}\n\n" for i, speech in enumerate(meeting_minutes))
   with open(f"{filename}-{timestamp}", "w") as file:
-    for i, speech in enumerate(meeting_minutes):
-      file.write
+    file.write(minutes)